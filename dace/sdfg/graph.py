@@ -248,6 +248,12 @@ class Graph(Generic[NodeT, EdgeT]):
         Returns the added edge."""
         raise self._not_implemented_error()
 
+    def add_edges_from(self, edge_list: Iterable[Sequence[Any]]):
+        """Adds edges from an iterable of ``add_edge`` argument tuples to the
+        graph. Returns a list of the added edges."""
+        add_edge = self.add_edge
+        return [add_edge(*edge) for edge in edge_list]
+
     def remove_node(self, node: NodeT):
         """Removes the specified node."""
         raise self._not_implemented_error()
@@ -493,6 +499,9 @@ class SubgraphView(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
     def add_edge(self, source, destination, data):
         raise PermissionError
 
+    def add_edges_from(self, edge_list):
+        raise PermissionError
+
     def remove_node(self, node):
         raise PermissionError
 
@@ -700,6 +709,27 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         del self._nodes[dst][0][t]
         del self._edges[t]
 
+    def relink_dst(self, old_dst: NodeT, new_dst: NodeT):
+        """Changes the destination of all edges leading to ``old_dst`` to
+        ``new_dst``."""
+        for edge in self.in_edges(old_dst):
+            self.remove_edge(edge)
+            self.add_edge(edge.src, new_dst, edge.data)
+
+    def relink_src(self, old_src: NodeT, new_src: NodeT):
+        """Changes the source of all edges leaving ``old_src`` to
+        ``new_src``."""
+        for edge in self.out_edges(old_src):
+            self.remove_edge(edge)
+            self.add_edge(new_src, edge.dst, edge.data)
+
+    def predecessors(self, node: NodeT) -> List[NodeT]:
+        # Edges are keyed by unique (src, dst) tuples
+        return [src for src, _ in self._nodes[node][0]]
+
+    def successors(self, node: NodeT) -> List[NodeT]:
+        return [dst for _, dst in self._nodes[node][1]]
+
     def in_degree(self, node):
         return len(self._nodes[node][0])
 
@@ -712,6 +742,17 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
     def number_of_edges(self):
         return len(self._edges)
 
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def source_nodes(self) -> List[NodeT]:
+        """Returns nodes with no incoming edges."""
+        return [n for n, (in_edges, _) in self._nodes.items() if not in_edges]
+
+    def sink_nodes(self) -> List[NodeT]:
+        """Returns nodes with no outgoing edges."""
+        return [n for n, (_, out_edges) in self._nodes.items() if not out_edges]
+
     def is_directed(self):
         return True
 
@@ -759,12 +800,69 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         del self._nodes[edge.dst][0][edge]
         self._nx.remove_edge(edge.src, edge.dst, edge.key)
 
+    def _relink_nx_edge(self, edge: MultiEdge[EdgeT], src: NodeT, dst: NodeT):
+        attributes = self._nx.edges[edge.src, edge.dst, edge.key]
+        attributes['data'] = edge.data
+        if isinstance(edge, MultiConnectorEdge):
+            attributes['src_conn'] = edge.src_conn
+            attributes['dst_conn'] = edge.dst_conn
+        self._nx.remove_edge(edge.src, edge.dst, edge.key)
+        edge._key = self._nx.add_edge(src, dst, **attributes)
+
+    def relink_dst(self, old_dst: NodeT,
+                   new_dst: NodeT) -> Iterable[MultiEdge[EdgeT]]:
+        """Changes the destination of all edges leading to ``old_dst`` to
+        ``new_dst``. The edge objects are modified in place (keeping their
+        position in the edge order) and an iterable of them is returned."""
+        if old_dst is new_dst:
+            return self.in_edges(old_dst)
+        if new_dst not in self._nodes:
+            self.add_node(new_dst)
+        in_edges, out_edges = self._nodes[old_dst]
+        self._nodes[old_dst] = (OrderedDict(), out_edges)
+        # Edges are keyed by identity, so the source nodes' outgoing edge
+        # dictionaries remain valid
+        for edge in in_edges:
+            self._relink_nx_edge(edge, edge.src, new_dst)
+            edge._dst = new_dst
+        self._nodes[new_dst][0].update(in_edges)
+        # The detached dictionary is not modified further, so its view can be
+        # returned without copying
+        return in_edges.values()
+
+    def relink_src(self, old_src: NodeT,
+                   new_src: NodeT) -> Iterable[MultiEdge[EdgeT]]:
+        """Changes the source of all edges leaving ``old_src`` to
+        ``new_src``. The edge objects are modified in place (keeping their
+        position in the edge order) and an iterable of them is returned."""
+        if old_src is new_src:
+            return self.out_edges(old_src)
+        if new_src not in self._nodes:
+            self.add_node(new_src)
+        in_edges, out_edges = self._nodes[old_src]
+        self._nodes[old_src] = (in_edges, OrderedDict())
+        for edge in out_edges:
+            self._relink_nx_edge(edge, new_src, edge.dst)
+            edge._src = new_src
+        self._nodes[new_src][1].update(out_edges)
+        # The detached dictionary is not modified further, so its view can be
+        # returned without copying
+        return out_edges.values()
+
     def in_edges(self, node) -> List[MultiEdge[EdgeT]]:
         return super().in_edges(node)
 
     def out_edges(self, node) -> List[MultiEdge[EdgeT]]:
         return super().out_edges(node)
 
+    def predecessors(self, node: NodeT) -> List[NodeT]:
+        # Deduplicate multiple edges while keeping the order of first
+        # appearance
+        return list(dict.fromkeys(e.src for e in self._nodes[node][0]))
+
+    def successors(self, node: NodeT) -> List[NodeT]:
+        return list(dict.fromkeys(e.dst for e in self._nodes[node][1]))
+
     def edges_between(self, source: NodeT,
                       destination: NodeT) -> List[MultiEdge[EdgeT]]:
         return super().edges_between(source, destination)
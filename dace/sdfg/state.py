@@ -842,6 +842,20 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet],
         self._clear_scopedict_cache()
         super(SDFGState, self).remove_edge(edge)
 
+    def relink_dst(self, old_dst, new_dst):
+        self._clear_scopedict_cache()
+        edges = super(SDFGState, self).relink_dst(old_dst, new_dst)
+        for edge in edges:
+            edge.data.try_initialize(self.parent, self, edge)
+        return edges
+
+    def relink_src(self, old_src, new_src):
+        self._clear_scopedict_cache()
+        edges = super(SDFGState, self).relink_src(old_src, new_src)
+        for edge in edges:
+            edge.data.try_initialize(self.parent, self, edge)
+        return edges
+
     def remove_edge_and_connectors(self, edge):
         self._clear_scopedict_cache()
         super(SDFGState, self).remove_edge(edge)
@@ -38,29 +38,71 @@ def node_path_graph(*args):
     # 3. Add nodes to the graph.
     path.add_nodes_from(input_nodes)
     # 4. Add path edges to the graph.
-    for i in range(len(input_nodes) - 1):
-        path.add_edge(input_nodes[i], input_nodes[i + 1], None)
+    path.add_edges_from(
+        (src, dst, None) for src, dst in zip(input_nodes, input_nodes[1:]))
     # 5. Return the graph.
     return path
 
 
-def depth_limited_search(source, depth):
+def depth_limited_search(source, depth, memoize=False, executor=None):
     """ Return best node and its value using a limited-depth Search (depth-
-        limited DFS). """
-    value = source.evaluate()
+        limited DFS).
+
+        :param source: The node to start the search from.
+        :param depth: The maximal search depth.
+        :param memoize: If True, caches the value of each evaluated node, so
+                        that nodes reachable via multiple paths are only
+                        evaluated once. Requires nodes to be hashable and
+                        ``evaluate`` to be side-effect free.
+        :param executor: An optional ``concurrent.futures.Executor``. If
+                         given, the subtrees of the children of ``source``
+                         are searched in parallel. Use a process pool
+                         (requires picklable nodes) if ``evaluate`` holds the
+                         GIL, or a thread pool otherwise.
+    """
+    if memoize:
+        evaluations = {}
+
+        def evaluate(node):
+            try:
+                return evaluations[node]
+            except KeyError:
+                value = evaluations[node] = node.evaluate()
+                return value
+    else:
+
+        def evaluate(node):
+            return node.evaluate()
+
+    value = evaluate(source)
     if depth == 0:
         return source, value
 
     candidate = source
     candidate_value = value
 
+    if executor is not None:
+        # Search each subtree independently and reduce in the original order,
+        # so that ties are resolved as in the sequential search
+        children = list(source.children_iter())
+        chunksize = max(1, len(children) // (4 * (os.cpu_count() or 1)))
+        results = executor.map(depth_limited_search,
+                               children, [depth - 1] * len(children),
+                               [memoize] * len(children),
+                               chunksize=chunksize)
+        for child, child_val in results:
+            if child_val > candidate_value:
+                candidate = child
+                candidate_value = child_val
+        return candidate, candidate_value
+
     # Node, depth, children generator
-    stack = [(source, 0, source.children_iter())]
+    stack = collections.deque([(source, 0, source.children_iter())])
     while stack:
         node, cur_depth, children = stack[-1]
         try:
             child = next(children)
-            child_val = child.evaluate()
+            child_val = evaluate(child)
             # Check for best candidate
             if child_val > candidate_value:
                 candidate = child
@@ -81,17 +123,17 @@ def depth_limited_dfs_iter(source, depth):
         yield source
         return
 
-    # Node, depth, children generator
-    stack = [(source, 0, source.children_iter())]
+    # Children generators. The depth of each generator's parent is its index
+    # in the stack, so neither nodes nor depths need to be stored
+    stack = [source.children_iter()]
     while stack:
-        node, cur_depth, children = stack[-1]
-        try:
-            child = next(children)
+        for child in stack[-1]:
             yield child
 
-            if cur_depth < depth - 1:
-                stack.append((child, cur_depth + 1, child.children_iter()))
-        except StopIteration:
+            if len(stack) < depth:
+                stack.append(child.children_iter())
+                break
+        else:
             stack.pop()
 
 
@@ -119,39 +161,57 @@ def dfs_topological_sort(G, sources=None, condition=None):
     if sources is None:
         # produce edges for all components
         nodes = G
-    else:
+    elif (isinstance(sources, collections.abc.Iterable)
+          and not isinstance(sources, str)):
         # produce edges for components with source
-        try:
-            nodes = iter(sources)
-        except TypeError:
-            nodes = [sources]
+        nodes = sources
+    else:
+        nodes = [sources]
+
+    # Unvisited predecessors of nodes that were encountered before all of their
+    # predecessors were visited. The lists are pruned (from the back) on every
+    # subsequent encounter, so that each predecessor is only checked once
+    # after it has been visited.
+    pending = {}
 
     visited = set()
+    visit = visited.add
+    neighbors = G.neighbors
+    predecessors = G.predecessors
     for start in nodes:
         if start in visited:
             continue
         yield start
-        visited.add(start)
-        stack = [(start, iter(G.neighbors(start)))]
+        visit(start)
+        stack = [(start, iter(neighbors(start)))]
         while stack:
             parent, children = stack[-1]
-            try:
-                child = next(children)
-                if child not in visited:
-                    # Make sure that all predecessors have been visited
-                    skip = False
-                    for pred in G.predecessors(child):
-                        if pred not in visited:
-                            skip = True
-                            break
-                    if skip:
+            for child in children:
+                if child in visited:
+                    continue
+                # Make sure that all predecessors have been visited
+                unvisited_preds = pending.get(child)
+                if unvisited_preds is None:
+                    unvisited_preds = [
+                        pred for pred in predecessors(child)
+                        if pred not in visited
+                    ]
+                    if unvisited_preds:
+                        pending[child] = unvisited_preds
                         continue
+                else:
+                    while unvisited_preds and unvisited_preds[-1] in visited:
+                        unvisited_preds.pop()
+                    if unvisited_preds:
+                        continue
+                    del pending[child]
 
-                    visited.add(child)
-                    if condition is None or condition(parent, child):
-                        yield child
-                        stack.append((child, iter(G.neighbors(child))))
-            except StopIteration:
+                visit(child)
+                if condition is None or condition(parent, child):
+                    yield child
+                    stack.append((child, iter(neighbors(child))))
+                    break
+            else:
                 stack.pop()
 
 
@@ -174,12 +234,12 @@ def dfs_conditional(G, sources=None, condition=None):
     if sources is None:
         # produce edges for all components
         nodes = G
-    else:
+    elif (isinstance(sources, collections.abc.Iterable)
+          and not isinstance(sources, str)):
         # produce edges for components with source
-        try:
-            nodes = iter(sources)
-        except TypeError:
-            nodes = [sources]
+        nodes = sources
+    else:
+        nodes = [sources]
 
     visited = set()
     for start in nodes:
@@ -207,28 +267,16 @@ def change_edge_dest(graph: gr.OrderedDiGraph,
     """ Changes the destination of edges from node A to node B.
 
         The function finds all edges in the graph that have node A as their
-        destination. It then creates a new edge for each one found,
-        using the same source nodes and data, but node B as the destination.
-        Afterwards, it deletes the edges found and inserts the new ones into
-        the graph.
+        destination and relinks them to node B, keeping the same source
+        nodes, connectors and data. In multigraphs (e.g., SDFG states), the
+        edge objects are modified in place.
 
         :param graph: The graph upon which the edge transformations will be
                       applied.
         :param node_a: The original destination of the edges.
         :param node_b: The new destination of the edges to be transformed.
     """
-
-    # Create new incoming edges to node B, by copying the incoming edges to
-    # node A and setting their destination to node B.
-    edges = list(graph.in_edges(node_a))
-    for e in edges:
-        # Delete the incoming edges to node A from the graph.
-        graph.remove_edge(e)
-        # Insert the new edges to the graph.
-        if isinstance(e, gr.MultiConnectorEdge):
-            graph.add_edge(e.src, e.src_conn, node_b, e.dst_conn, e.data)
-        else:
-            graph.add_edge(e.src, node_b, e.data)
+    graph.relink_dst(node_a, node_b)
 
 
 def change_edge_src(graph: gr.OrderedDiGraph,
@@ -237,28 +285,16 @@ def change_edge_src(graph: gr.OrderedDiGraph,
     """ Changes the sources of edges from node A to node B.
 
         The function finds all edges in the graph that have node A as their
-        source. It then creates a new edge for each one found, using the same
-        destination nodes and data, but node B as the source. Afterwards, it
-        deletes the edges
-        found and inserts the new ones into the graph.
+        source and relinks them to node B, keeping the same destination
+        nodes, connectors and data. In multigraphs (e.g., SDFG states), the
+        edge objects are modified in place.
 
         :param graph: The graph upon which the edge transformations will be
                       applied.
         :param node_a: The original source of the edges to be transformed.
         :param node_b: The new source of the edges to be transformed.
     """
-
-    # Create new outgoing edges from node B, by copying the outgoing edges from
-    # node A and setting their source to node B.
-    edges = list(graph.out_edges(node_a))
-    for e in edges:
-        # Delete the outgoing edges from node A from the graph.
-        graph.remove_edge(e)
-        # Insert the new edges to the graph.
-        if isinstance(e, gr.MultiConnectorEdge):
-            graph.add_edge(node_b, e.src_conn, e.dst, e.dst_conn, e.data)
-        else:
-            graph.add_edge(node_b, e.dst, e.data)
+    graph.relink_src(node_a, node_b)
 
 
 def find_source_nodes(graph):
@@ -270,7 +306,9 @@ def find_source_nodes(graph):
         :param graph: The graph whose source nodes are being searched for.
         :return: A list of the source nodes found.
     """
-    return [n for n in graph.nodes() if graph.in_degree(n) == 0]
+    if isinstance(graph, gr.Graph):
+        return graph.source_nodes()
+    return [n for n, degree in graph.in_degree() if degree == 0]
 
 
 def find_sink_nodes(graph):
@@ -281,7 +319,9 @@ def find_sink_nodes(graph):
         :param graph: The graph whose sink nodes are being searched for.
         :return: A list of the sink nodes found.
     """
-    return [n for n in graph.nodes() if graph.out_degree(n) == 0]
+    if isinstance(graph, gr.Graph):
+        return graph.sink_nodes()
+    return [n for n, degree in graph.out_degree() if degree == 0]
 
 
 ParamsType = List['dace.symbolic.symbol']
@@ -301,15 +341,22 @@ def merge_maps(
     (r1.ranges + r2.ranges)
 ) -> (nd.MapEntry, nd.MapExit):
     """ Merges two maps (their entries and exits). It is assumed that the
-    operation is valid. """
+    operation is valid.
+
+    The merged map is a shallow copy of the outer map with new parameters
+    and ranges, and the merged entry/exit nodes receive their own copies of
+    the outer connector dictionaries (assigning a connector property copies
+    the dictionary). The merged nodes therefore do not share mutable state
+    with the original nodes, and no deep copy is necessary. """
 
     outer_map = outer_map_entry.map
     inner_map = inner_map_entry.map
 
     # Create merged map by inheriting attributes from outer map and using
-    # the merge functions for parameters and ranges.
-    merged_map = copy.deepcopy(outer_map)
-    merged_map.label = outer_map.label
+    # the merge functions for parameters and ranges. Parameters and ranges
+    # are replaced, so a deep copy of the outer map is unnecessary.
+    merged_map = copy.copy(outer_map)
+    merged_map.debuginfo = copy.copy(outer_map.debuginfo)
     merged_map.params = param_merge(outer_map.params, inner_map.params)
     merged_map.range = range_merge(outer_map.range, inner_map.range)
 
@@ -323,15 +370,32 @@ def merge_maps(
 
     graph.add_nodes_from([merged_entry, merged_exit])
 
+    # Edges between the two maps, indexed by the matching connector on the
+    # other side of the inner map node (e.g., the edge to IN_A is found via
+    # OUT_A), so that no connector names are built per edge below. The first
+    # edge is used for each connector, as in memlet paths.
+    inner_in_edges = {}
+    for edge in graph.in_edges(inner_map_entry):
+        if edge.dst_conn is not None and edge.dst_conn.startswith('IN_'):
+            inner_in_edges.setdefault('OUT_' + edge.dst_conn[3:], edge)
+    inner_out_edges = {}
+    for edge in graph.out_edges(inner_map_exit):
+        if edge.src_conn is not None and edge.src_conn.startswith('OUT_'):
+            inner_out_edges.setdefault('IN_' + edge.src_conn[4:], edge)
+
     # Handle the case of dynamic map inputs in the inner map
     inner_dynamic_map_inputs = dynamic_map_inputs(graph, inner_map_entry)
+    if inner_dynamic_map_inputs:
+        outer_in_edges = {}
+        for edge in graph.in_edges(outer_map_entry):
+            outer_in_edges.setdefault(edge.dst_conn, edge)
     for edge in inner_dynamic_map_inputs:
         conn_to_remove = edge.src_conn[4:]
         merged_entry.remove_in_connector('IN_' + conn_to_remove)
         merged_entry.remove_out_connector('OUT_' + conn_to_remove)
         merged_entry.add_in_connector(
             edge.dst_conn, inner_map_entry.in_connectors[edge.dst_conn])
-        outer_edge = next(graph.in_edges_by_connector(outer_map_entry, 'IN_' + conn_to_remove))
+        outer_edge = outer_in_edges['IN_' + conn_to_remove]
         graph.add_edge(outer_edge.src, outer_edge.src_conn, merged_entry, edge.dst_conn,
                        outer_edge.data)
         graph.remove_edge(outer_edge)
@@ -343,12 +407,10 @@ def merge_maps(
                            edge.data)
             continue
 
-        # Get memlet path and edge
-        path = graph.memlet_path(edge)
-        ind = path.index(edge)
         # Add an edge directly from the previous source connector to the
         # destination
-        graph.add_edge(merged_entry, path[ind - 1].src_conn, edge.dst,
+        outer_edge = inner_in_edges[edge.src_conn]
+        graph.add_edge(merged_entry, outer_edge.src_conn, edge.dst,
                        edge.dst_conn, edge.data)
 
     # Redirect inner out edges.
@@ -358,13 +420,11 @@ def merge_maps(
                            edge.data)
             continue
 
-        # Get memlet path and edge
-        path = graph.memlet_path(edge)
-        ind = path.index(edge)
         # Add an edge directly from the source to the next destination
         # connector
+        outer_edge = inner_out_edges[edge.dst_conn]
         graph.add_edge(edge.src, edge.src_conn, merged_exit,
-                       path[ind + 1].dst_conn, edge.data)
+                       outer_edge.dst_conn, edge.data)
 
     # Redirect outer edges.
     change_edge_dest(graph, outer_map_entry, merged_entry)
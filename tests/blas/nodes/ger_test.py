@@ -23,7 +23,8 @@ def pure_graph(implementation, dtype, veclen):
     n = dace.symbol("n")
     vtype = dace.vector(dtype, veclen)
 
-    sdfg = dace.SDFG("ger_test")
+    sdfg_name = f"ger_{implementation}_{dtype.ctype}_w{veclen}"
+    sdfg = dace.SDFG(sdfg_name)
 
     state = sdfg.add_state("ger")
 
@@ -62,7 +63,9 @@ def pure_graph(implementation, dtype, veclen):
 def fpga_graph(dtype, veclen, tile_size_x, tile_size_y):
     ger_node, state, sdfg = pure_graph("FPGA", dtype, veclen)
     ger_node.expand(sdfg, state, tile_size_x=tile_size_x, tile_size_y=tile_size_y)
-    sdfg.apply_transformations_repeated([FPGATransformSDFG, InlineSDFG])
+    # Intermediate result, validated after the final transformations below
+    sdfg.apply_transformations_repeated([FPGATransformSDFG, InlineSDFG],
+                                        validate=False)
     sdfg.expand_library_nodes()
     sdfg.apply_transformations_repeated(
         [InlineSDFG, StreamingMemory], [{}, {
@@ -73,21 +76,18 @@ def fpga_graph(dtype, veclen, tile_size_x, tile_size_y):
 
 def run_test(ger, target):
 
-    x = np.ndarray(m, dtype=np.float32)
-    y = np.ndarray(n, dtype=np.float32)
-    A = np.ndarray((m, n), dtype=np.float32)
-    res = A.copy()
-    ref = res.copy()
-
-    x[:] = np.random.rand(m).astype(np.float32)
-    y[:] = np.random.rand(n).astype(np.float32)
-    A[:] = np.random.rand(m, n).astype(np.float32)
+    x = aligned_ndarray(np.random.rand(m).astype(np.float32), alignment=4*veclen)
+    y = aligned_ndarray(np.random.rand(n).astype(np.float32), alignment=4*veclen)
+    A = aligned_ndarray(np.random.rand(m, n).astype(np.float32), alignment=4*veclen)
+    res = aligned_ndarray(np.empty(A.shape, dtype=A.dtype), alignment=4*veclen)
+    res[:] = A[:]
 
     ger(alpha=alpha, x=x, y=y, A=A, res=res, m=m, n=n)
 
     ref = scipy.linalg.blas.sger(alpha=alpha, x=x, y=y, a=A)
 
-    diff = np.linalg.norm(np.subtract(res, ref))
+    # Compute the residual in place, res is not used afterwards
+    diff = np.linalg.norm(np.subtract(res, ref, out=res))
     if diff >= args.eps * n * m:
         raise RuntimeError(
             "Unexpected result returned from ger rank 1 operation: "
@@ -137,7 +137,8 @@ if __name__ == "__main__":
 
     ref = scipy.linalg.blas.sger(alpha=alpha, x=x, y=y, a=ref)
 
-    diff = np.linalg.norm(res - ref)
+    # Compute the residual in place, ref is not used afterwards
+    diff = np.linalg.norm(np.subtract(res, ref, out=ref))
     if diff >= args.eps * n * m:
         raise RuntimeError(f"Validation failed: {diff}")
     else:
@@ -64,7 +64,7 @@ TESTS = [
      ["--target", "tiles_by_column", "--transpose", "--vectorize", 4]),
     ("tests/blas/nodes/gemv_test.py", "gemv_FPGA_Accumulate_float_False_w4_1",
      ["--target", "accumulate", "--vectorize", 4]),
-    ("tests/blas/nodes/ger_test.py", "ger_test_1", ["--target", "fpga"]),
+    ("tests/blas/nodes/ger_test.py", "ger_FPGA_float_w8_1", ["--target", "fpga"]),
     ("tests/fpga/gemm_fpga.py",
      ["gemm_not_multiple_of", "gemm_vectorized", "matmul_np_1"], []),
     # STL
@@ -52,7 +52,7 @@ TESTS = [
      ["--target", "tiles_by_column", "--transpose", "--vectorize", "4"]),
     ("tests/blas/nodes/gemv_test.py", "gemv_FPGA_Accumulate_float_False_w4_1",
      True, True, ["--target", "accumulate", "--vectorize", "4"]),
-    ("tests/blas/nodes/ger_test.py", "ger_test_1", True, True,
+    ("tests/blas/nodes/ger_test.py", "ger_FPGA_float_w8_1", True, True,
      ["--target", "fpga"]),
     # This test contains three SDFGs: full check only the first one for the sake of testing time
     ("tests/fpga/gemm_fpga.py", "gemm_vectorized", True, True, []),
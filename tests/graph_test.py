@@ -106,6 +106,42 @@ class TestOrderedGraphs(unittest.TestCase):
         self.assertEqual(next(bfs_edges), e6)
         self.assertEqual(next(bfs_edges), e7)
 
+    def test_add_edges_from(self):
+        g = OrderedMultiDiConnectorGraph()
+        edges = g.add_edges_from([(0, 'a', 1, 'b', "abc"),
+                                  (0, None, 2, None, "def"),
+                                  (1, 'c', 2, 'd', "ghi")])
+        self.assertEqual(g.number_of_nodes(), 3)
+        self.assertEqual(g.number_of_edges(), 3)
+        self.assertEqual(list(g.edges()), edges)
+        self.assertEqual(edges[0].src_conn, 'a')
+        self.assertEqual(edges[2].dst_conn, 'd')
+        self.assertEqual(g.in_degree(2), 2)
+
+    def test_relink(self):
+        g = OrderedMultiDiConnectorGraph()
+        e0 = g.add_edge(0, 'a', 1, 'b', "abc")
+        e1 = g.add_edge(2, 'c', 1, 'd', "def")
+        e2 = g.add_edge(1, 'e', 3, 'f', "ghi")
+        g.add_node(4)
+        self.assertEqual(list(g.relink_dst(1, 4)), [e0, e1])
+        self.assertEqual(g.in_degree(1), 0)
+        self.assertEqual(g.in_edges(4), [e0, e1])
+        self.assertEqual(g.out_edges(0), [e0])
+        self.assertEqual(e1.dst, 4)
+        self.assertEqual(e1.dst_conn, 'd')
+        self.assertEqual(list(g.relink_src(1, 5)), [e2])
+        self.assertEqual(g.out_degree(1), 0)
+        self.assertEqual(g.out_edges(5), [e2])
+        self.assertEqual(g.in_edges(3), [e2])
+        self.assertEqual(list(g.edges()), [e0, e1, e2])
+        self.assertEqual(g.number_of_nodes(), 6)
+        self.assertTrue(g.nx.has_edge(2, 4))
+        self.assertFalse(g.nx.has_edge(2, 1))
+        self.assertTrue(g.nx.has_edge(5, 3))
+        g.remove_node(4)
+        self.assertEqual(list(g.edges()), [e2])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 import networkx as nx
 from dace.sdfg.utils import *
 
@@ -34,6 +35,49 @@ class TestDLS(unittest.TestCase):
         self.assertEqual(depth_limited_search(sspace, 5)[1], 8)
         self.assertEqual(depth_limited_search(sspace, 1000)[1], 8)
 
+    def test_memoize(self):
+        class CountingSearchSpace(GraphSearchSpace):
+            evaluations = 0
+
+            def __eq__(self, other):
+                return self.node == other.node
+
+            def __hash__(self):
+                return hash(self.node)
+
+            def evaluate(self):
+                CountingSearchSpace.evaluations += 1
+                return self.node
+
+            def children_iter(self):
+                for _, child in self.graph.out_edges(self.node):
+                    yield CountingSearchSpace(self.graph, child)
+
+        graph = nx.DiGraph()
+        graph.add_edges_from([(0, 1), (0, 2), (1, 3), (2, 3), (3, 4)])
+        sspace = CountingSearchSpace(graph, 0)
+        self.assertEqual(depth_limited_search(sspace, 3)[1], 4)
+        self.assertEqual(CountingSearchSpace.evaluations, 7)
+        CountingSearchSpace.evaluations = 0
+        self.assertEqual(
+            depth_limited_search(sspace, 3, memoize=True)[1], 4)
+        self.assertEqual(CountingSearchSpace.evaluations, 5)
+
+    def test_parallel(self):
+        graph = nx.DiGraph()
+        graph.add_nodes_from([-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5, 6, 7, 8])
+        graph.add_edges_from([(-5, -1), (-1, 1), (-2, 2), (-1, 5), (1, 6),
+                              (2, 6), (-3, 3), (-4, 4), (3, 7), (4, 8),
+                              (5, -4), (-5, -3)])
+        sspace = GraphSearchSpace(graph, -5)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for depth in [0, 1, 2, 3, 4, 5, 1000]:
+                self.assertEqual(
+                    depth_limited_search(sspace, depth,
+                                         executor=executor)[1],
+                    depth_limited_search(sspace, depth)[1])
+
     def test_iter(self):
         graph = nx.DiGraph()
         graph.add_nodes_from([-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5, 6, 7, 8])
@@ -56,5 +100,35 @@ class TestDLS(unittest.TestCase):
         self.assertEqual(winner(sspace, 1000)[1], 8)
 
 
+class TestDFSTopologicalSort(unittest.TestCase):
+    def test_predecessors_visited(self):
+        graph = nx.DiGraph()
+        graph.add_edges_from([(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (1, 4)])
+        order = list(dfs_topological_sort(graph, sources=[0]))
+        self.assertEqual(order, [0, 1, 2, 3, 4])
+
+    def test_multiple_sources(self):
+        graph = nx.DiGraph()
+        graph.add_edges_from([(0, 2), (1, 2), (2, 3), (1, 4)])
+        self.assertEqual(list(dfs_topological_sort(graph, sources=[0])), [0])
+        self.assertEqual(list(dfs_topological_sort(graph, sources=[0, 1])),
+                         [0, 1, 2, 3, 4])
+
+    def test_single_source(self):
+        graph = nx.DiGraph()
+        graph.add_edges_from([('a', 'b'), ('b', 'c'), ('x', 'y')])
+        self.assertEqual(list(dfs_topological_sort(graph, sources='a')),
+                         ['a', 'b', 'c'])
+
+    def test_condition(self):
+        graph = nx.DiGraph()
+        graph.add_edges_from([(0, 1), (1, 2), (0, 3)])
+        order = list(
+            dfs_topological_sort(graph,
+                                 sources=[0],
+                                 condition=lambda p, c: c != 1))
+        self.assertEqual(order, [0, 3])
+
+
 if __name__ == "__main__":
     unittest.main()